@@ -13,13 +13,17 @@ import asyncio
 import russo
 from russo.evaluators import ExactEvaluator
 
-
 # ---------------------------------------------------------------------------
 # Fakes — replace with real adapters in production
 # ---------------------------------------------------------------------------
+# 100 ms of 16-bit mono silence at 24 kHz, shared by every fake call so the
+# payload (and its base64 form, cached on first send) is only built once.
+SILENCE = russo.Audio(data=bytes(4800), format="wav", sample_rate=24000)
+
+
 class FakeSynthesizer:
     async def synthesize(self, text: str) -> russo.Audio:
-        return russo.Audio(data=b"\x00" * 4800, format="wav", sample_rate=24000)
+        return SILENCE
 
 
 @russo.agent
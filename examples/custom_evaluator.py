@@ -11,6 +11,7 @@ This example builds a "fuzzy" evaluator that:
 """
 
 import asyncio
+from collections import defaultdict
 
 import russo
 from russo._types import EvalResult, ToolCall, ToolCallMatch
@@ -21,18 +22,24 @@ class FuzzyEvaluator:
 
     def evaluate(self, expected: list[ToolCall], actual: list[ToolCall]) -> EvalResult:
         matches: list[ToolCallMatch] = []
-        remaining = list(actual)
+        # Bucket actual calls by lowercased name once, so each expected call
+        # only scans the candidates that share its name.
+        remaining: defaultdict[str, list[ToolCall]] = defaultdict(list)
+        for call in actual:
+            remaining[call.name.lower()].append(call)
 
         for exp in expected:
-            match = self._find_match(exp, remaining)
+            candidates = remaining[exp.name.lower()]
+            match = self._find_match(exp, candidates)
             matches.append(match)
-            if match.matched and match.actual in remaining:
-                remaining.remove(match.actual)
+            if match.matched and match.actual in candidates:
+                candidates.remove(match.actual)
 
         passed = all(m.matched for m in matches)
         return EvalResult(passed=passed, expected=expected, actual=actual, matches=matches)
 
     def _find_match(self, expected: ToolCall, candidates: list[ToolCall]) -> ToolCallMatch:
+        # Candidates already share the expected name (case-insensitively)
         for candidate in candidates:
             if self._is_match(expected, candidate):
                 return ToolCallMatch(expected=expected, actual=candidate, matched=True)
@@ -44,9 +51,6 @@ class FuzzyEvaluator:
         )
 
     def _is_match(self, expected: ToolCall, actual: ToolCall) -> bool:
-        # Case-insensitive name matching
-        if expected.name.lower() != actual.name.lower():
-            return False
         # Expected args must be a subset of actual args
         return all(actual.arguments.get(k) == v for k, v in expected.arguments.items())
 
@@ -137,7 +137,7 @@ async def example_websocket_custom_parser():
     agent = WebSocketAgent(
         url="ws://localhost:8000/ws/agent",
         parser=JsonResponseParser(tool_calls_key="toolCall"),
-        is_complete=lambda msgs: any(isinstance(m, dict) and m.get("status") == "done" for m in msgs),
+        is_complete=lambda msgs: isinstance(msgs[-1], dict) and msgs[-1].get("status") == "done",
         response_timeout=15.0,
     )
 
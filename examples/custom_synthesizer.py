@@ -11,6 +11,7 @@ These are useful for offline testing without incurring TTS API costs.
 """
 
 import asyncio
+import functools
 import hashlib
 from pathlib import Path
 
@@ -18,6 +19,12 @@ import russo
 from russo.evaluators import ExactEvaluator
 
 
+@functools.lru_cache(maxsize=1024)
+def prompt_key(text: str) -> str:
+    """SHA-256 prefix used to name a prompt's audio file, hashed once per prompt."""
+    return hashlib.sha256(text.encode()).hexdigest()[:16]
+
+
 class FileSynthesizer:
     """Reads pre-recorded audio files from a directory.
 
@@ -31,7 +38,7 @@ class FileSynthesizer:
         self.sample_rate = sample_rate
 
     async def synthesize(self, text: str) -> russo.Audio:
-        key = hashlib.sha256(text.encode()).hexdigest()[:16]
+        key = prompt_key(text)
         audio_path = self.audio_dir / f"{key}.{self.format}"
         if not audio_path.exists():
             raise FileNotFoundError(f"No pre-recorded audio for prompt (key={key}): {text!r}")
@@ -52,11 +59,11 @@ class SilenceSynthesizer:
     def __init__(self, duration_seconds: float = 1.0, sample_rate: int = 24000) -> None:
         self.duration_seconds = duration_seconds
         self.sample_rate = sample_rate
+        # bytes are immutable, so one buffer can back every Audio we return
+        self._pcm = b"\x00\x00" * int(sample_rate * duration_seconds)  # 16-bit silence
 
     async def synthesize(self, text: str) -> russo.Audio:
-        num_samples = int(self.sample_rate * self.duration_seconds)
-        silent_pcm = b"\x00\x00" * num_samples  # 16-bit silence
-        return russo.Audio(data=silent_pcm, format="wav", sample_rate=self.sample_rate)
+        return russo.Audio(data=self._pcm, format="wav", sample_rate=self.sample_rate)
 
 
 # --- Demo ---
@@ -82,8 +82,12 @@ async def example_custom_protocol():
         )
 
     def is_done(messages: list) -> bool:
-        """Stop collecting when the server sends a 'done' message."""
-        return any(isinstance(m, dict) and m.get("type") == "done" for m in messages)
+        """Stop collecting when the server sends a 'done' message.
+
+        Called after every message, so only the newest one needs checking.
+        """
+        last = messages[-1]
+        return isinstance(last, dict) and last.get("type") == "done"
 
     def aggregate_responses(messages: list):
         """Combine all tool_call messages into one response."""
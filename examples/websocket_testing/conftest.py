@@ -1,28 +1,24 @@
 """pytest conftest.py — server lifecycle + russo fixtures for WebSocket testing.
 
-Starts a websockets server as a subprocess, wires up GoogleSynthesizer,
-WebSocketAgent, and ExactEvaluator for end-to-end russo tests.
+Runs the websockets server in-process on a background event loop, wires up
+GoogleSynthesizer, WebSocketAgent, and ExactEvaluator for end-to-end russo tests.
 
 Requires Google AI or Vertex AI credentials in the environment.
 """
 
 from __future__ import annotations
 
+import asyncio
 import os
-import pathlib
-import socket
-import subprocess
-import sys
-import time
+import threading
 
 import pytest
+from server import new_event_loop, start_server
 
 from russo.adapters import WebSocketAgent
 from russo.evaluators import ExactEvaluator
 from russo.synthesizers import GoogleSynthesizer
 
-_SERVER_SCRIPT = str(pathlib.Path(__file__).parent / "server.py")
-
 # Expand ~ in GOOGLE_APPLICATION_CREDENTIALS — the google-auth library
 # doesn't do this, so a value like "~/.config/gcloud/..." would fail.
 _creds_path = os.environ.get("GOOGLE_APPLICATION_CREDENTIALS", "")
@@ -35,57 +31,48 @@ def _gcp_project() -> str | None:
     return os.environ.get("GOOGLE_CLOUD_PROJECT") or os.environ.get("GOOGLE_PROJECT_ID")
 
 
-def _find_free_port() -> int:
-    """Find an available TCP port."""
-    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-        s.bind(("", 0))
-        return s.getsockname()[1]
-
-
-def _wait_for_server(port: int, timeout: float = 15.0) -> None:
-    """Poll until the server accepts connections."""
-    deadline = time.monotonic() + timeout
-    while time.monotonic() < deadline:
-        try:
-            with socket.create_connection(("localhost", port), timeout=1.0):
-                return
-        except OSError:
-            time.sleep(0.3)
-    msg = f"Server on port {port} did not start within {timeout}s"
-    raise TimeoutError(msg)
-
-
 # ---------------------------------------------------------------------------
 # Server lifecycle
 # ---------------------------------------------------------------------------
+async def _stop_server(server) -> None:
+    server.close()
+    await server.wait_closed()
+
+
 @pytest.fixture(scope="session")
 def travel_agent_server():
-    """Start the WebSocket server and yield the port number."""
-    port = _find_free_port()
-    proc = subprocess.Popen(
-        [sys.executable, _SERVER_SCRIPT, "--port", str(port)],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-    )
+    """Start the WebSocket server and yield the port number.
+
+    The server runs on its own event loop in a daemon thread, so it outlives
+    the per-test loops pytest-asyncio creates. ``start_server`` returns once
+    the socket is listening, so no readiness polling is needed.
+    """
+    loop = new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, name="travel-agent-server", daemon=True)
+    thread.start()
+    server = asyncio.run_coroutine_threadsafe(start_server(0), loop).result(timeout=15)
     try:
-        _wait_for_server(port)
-        yield port
+        yield server.sockets[0].getsockname()[1]
     finally:
-        proc.terminate()
-        proc.wait(timeout=5)
+        asyncio.run_coroutine_threadsafe(_stop_server(server), loop).result(timeout=5)
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout=5)
+        loop.close()
 
 
 # ---------------------------------------------------------------------------
 # russo fixtures
 # ---------------------------------------------------------------------------
-@pytest.fixture
+@pytest.fixture(scope="session")
 def russo_synthesizer():
     """Google TTS synthesizer — uses Vertex AI if project is set, else API key.
 
-    Function-scoped so each test gets a fresh genai.Client (its internal
-    asyncio.Lock binds to the current event loop and can't be reused across
-    the per-test loops that pytest-asyncio creates by default).  The russo
-    plugin wraps this in CachedSynthesizer, so TTS calls are still cached.
+    Session-scoped: GoogleSynthesizer rebuilds its genai.Client only when the
+    event loop changes, so it is safe across pytest-asyncio's per-test loops,
+    and with a session loop (``asyncio_default_test_loop_scope = "session"``
+    and ``asyncio_default_fixture_loop_scope = "session"``) one client serves
+    every test. The russo plugin wraps this in CachedSynthesizer, so TTS
+    calls are still cached.
     """
     project = _gcp_project()
     if project:
@@ -99,9 +86,15 @@ def russo_synthesizer():
 
 @pytest.fixture
 def russo_agent(travel_agent_server):
-    """WebSocketAgent pointing at the local WebSocket server."""
+    """WebSocketAgent pointing at the local WebSocket server.
+
+    The russo plugin enters the agent around each test, so every run in a
+    test shares one connection; the server echoes each request's ``id``, so
+    batched runs (``prompts=[...]``, ``runs=N``) are multiplexed over it
+    instead of opening a connection per run.
+    """
     port = travel_agent_server
-    return WebSocketAgent(url=f"ws://localhost:{port}")
+    return WebSocketAgent(url=f"ws://localhost:{port}", request_id_field="id")
 
 
 @pytest.fixture
@@ -14,16 +14,34 @@ from __future__ import annotations
 
 import argparse
 import asyncio
-import base64
-import io
+import functools
 import json
 import logging
 import os
 import signal
-import wave
 
 import websockets
 
+from russo.audio import AudioManager
+
+try:
+    # SIMD base64 (installed with russo[fast]); decoding multi-MB audio is noticeably faster.
+    from pybase64 import b64decode
+except ImportError:
+    from base64 import b64decode
+
+try:
+    # Parses the base64 audio string in one native pass (installed with russo[fast]).
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+try:
+    # libuv-based event loop (installed with russo[fast], POSIX only).
+    from uvloop import new_event_loop
+except ImportError:
+    from asyncio import new_event_loop
+
 logger = logging.getLogger("websocket_testing.server")
 
 # ---------------------------------------------------------------------------
@@ -81,15 +99,9 @@ SYSTEM_INSTRUCTION = (
 
 def _ensure_wav(audio_bytes: bytes, sample_rate: int = 24000) -> tuple[bytes, str]:
     """Wrap raw PCM in a WAV container if needed. Return (data, mime_type)."""
-    if len(audio_bytes) >= 4 and audio_bytes[:4] == b"RIFF":
+    if audio_bytes.startswith(b"RIFF"):
         return audio_bytes, "audio/wav"
-    buf = io.BytesIO()
-    with wave.open(buf, "wb") as wf:
-        wf.setnchannels(1)
-        wf.setsampwidth(2)
-        wf.setframerate(sample_rate)
-        wf.writeframes(audio_bytes)
-    return buf.getvalue(), "audio/wav"
+    return AudioManager.pcm_to_wav(audio_bytes, sample_rate=sample_rate), "audio/wav"
 
 
 def _expand_creds_path() -> None:
@@ -104,8 +116,13 @@ def _gcp_project() -> str | None:
     return os.environ.get("GOOGLE_CLOUD_PROJECT") or os.environ.get("GOOGLE_PROJECT_ID")
 
 
+@functools.cache
 def _make_client():
-    """Create a genai.Client using env-based auth (API key or Vertex AI)."""
+    """Create the shared genai.Client using env-based auth (API key or Vertex AI).
+
+    Built once and reused by every request, so the auth setup and the HTTP
+    connection pool are not recreated per message.
+    """
     from google import genai
 
     _expand_creds_path()
@@ -119,28 +136,66 @@ def _make_client():
     return genai.Client()
 
 
+@functools.cache
+def _generate_config():
+    """Build the request config (tools + system instruction) once."""
+    from google.genai import types
+
+    return types.GenerateContentConfig(
+        tools=TOOLS,
+        system_instruction=SYSTEM_INSTRUCTION,
+    )
+
+
 async def _handle_connection(ws: websockets.ServerConnection) -> None:
-    """Handle a single audio -> tool-call exchange."""
+    """Answer every audio message on the connection with its tool calls.
+
+    Clients may send one message per connection or keep the connection open
+    and send several (e.g. ``async with WebSocketAgent(...)``). Messages are
+    handled concurrently; a request's ``"id"`` is echoed on its reply so the
+    client can match replies that finish out of order.
+    """
+
+    async def reply(message: str | bytes) -> None:
+        response = await _handle_message(message)
+        try:
+            await ws.send(response)
+        except websockets.ConnectionClosed:
+            # The client left before this reply was ready; nothing to send it to.
+            logger.debug("Connection closed, dropping reply")
+
+    async with asyncio.TaskGroup() as tg:
+        async for message in ws:
+            tg.create_task(reply(message))
+
+
+async def _handle_message(message: str | bytes) -> str:
+    """Handle a single audio -> tool-call exchange.
+
+    Binary frames are the audio itself (``WebSocketAgent(send_bytes=True)``),
+    which skips base64 and JSON entirely. Text frames use the default JSON
+    protocol: ``{"audio": "<base64>", "format": "wav", "id": ...}``.
+    """
     from google.genai import types
 
+    request_id = None
     try:
-        raw = json.loads(await ws.recv())
-        audio_b64 = raw.get("audio", "")
-        audio_bytes = base64.b64decode(audio_b64)
+        if isinstance(message, bytes):
+            audio_bytes = message
+        else:
+            raw = json_loads(message)
+            request_id = raw.get("id")
+            audio_bytes = b64decode(raw.get("audio", ""))
 
         data, mime_type = _ensure_wav(audio_bytes)
 
         client = _make_client()
         contents = [types.Part.from_bytes(data=data, mime_type=mime_type)]
-        config = types.GenerateContentConfig(
-            tools=TOOLS,
-            system_instruction=SYSTEM_INSTRUCTION,
-        )
 
         response = await client.aio.models.generate_content(
             model="gemini-2.0-flash",
             contents=contents,
-            config=config,
+            config=_generate_config(),
         )
 
         tool_calls = []
@@ -157,22 +212,28 @@ async def _handle_connection(ws: websockets.ServerConnection) -> None:
                                 }
                             )
 
-        await ws.send(json.dumps({"tool_calls": tool_calls}))
+        return json.dumps({"id": request_id, "tool_calls": tool_calls})
 
     except Exception:
         logger.exception("Error processing audio")
-        await ws.send(json.dumps({"tool_calls": [], "error": "Internal server error"}))
+        return json.dumps({"id": request_id, "tool_calls": [], "error": "Internal server error"})
+
+
+async def start_server(port: int) -> websockets.Server:
+    """Start listening on *port* (0 picks a free one) and return the running server."""
+    server = await websockets.serve(_handle_connection, "localhost", port)
+    logger.info("WebSocket server listening on ws://localhost:%d", server.sockets[0].getsockname()[1])
+    return server
 
 
 async def serve(port: int) -> None:
-    """Start the WebSocket server on the given port."""
+    """Run the WebSocket server on the given port until SIGTERM/SIGINT."""
     stop = asyncio.get_running_loop().create_future()
 
     for sig in (signal.SIGTERM, signal.SIGINT):
         asyncio.get_running_loop().add_signal_handler(sig, stop.set_result, None)
 
-    async with websockets.serve(_handle_connection, "localhost", port):
-        logger.info("WebSocket server listening on ws://localhost:%d", port)
+    async with await start_server(port):
         await stop
 
 
@@ -181,4 +242,4 @@ if __name__ == "__main__":
     parser.add_argument("--port", type=int, default=8765)
     args = parser.parse_args()
     logging.basicConfig(level=logging.INFO)
-    asyncio.run(serve(args.port))
+    asyncio.run(serve(args.port), loop_factory=new_event_loop)
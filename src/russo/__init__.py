@@ -2,7 +2,7 @@
 
 from russo import adapters, evaluators, parsers, synthesizers  # noqa: F401
 from russo._assertions import ToolCallAssertionError, assert_tool_calls
-from russo._cache import AudioCache, CachedSynthesizer
+from russo._cache import AudioCache, CachedSynthesizer, MemoryAudioCache
 from russo._helpers import agent, tool_call
 from russo._pipeline import run, run_concurrent
 from russo._types import AgentResponse, Audio, BatchResult, EvalResult, SingleRunResult, ToolCall, ToolCallMatch
@@ -19,6 +19,7 @@ __all__ = [
     # Cache
     "AudioCache",
     "CachedSynthesizer",
+    "MemoryAudioCache",
     # Helpers
     "tool_call",
     "agent",
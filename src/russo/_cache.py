@@ -1,23 +1,87 @@
 """Audio caching for synthesized prompts.
 
 Saves synthesized audio to disk keyed by a hash of the prompt text,
-so repeated test runs skip the TTS call entirely.
+so repeated test runs skip the TTS call entirely. Entries read from disk
+are also kept in a small in-memory LRU, so prompts reused within one
+session don't touch the filesystem again.
 """
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import hashlib
 import json
 import logging
+import os
+import tempfile
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any
 
+from russo import _json
 from russo._protocols import Synthesizer
 from russo._types import Audio
 
 logger = logging.getLogger("russo.cache")
 
 _DEFAULT_CACHE_DIR = Path(".russo_cache")
+_DEFAULT_MEMORY_CAPACITY = 128
+
+
+@functools.lru_cache(maxsize=1024)
+def _digest(blob: str) -> str:
+    """SHA-256 of a cache-key blob, memoized across repeated prompts."""
+    return hashlib.sha256(blob.encode()).hexdigest()[:24]
+
+
+class MemoryAudioCache:
+    """In-memory LRU cache of Audio objects.
+
+    Used by AudioCache as a first-level cache in front of the file system.
+    A capacity of 0 disables it. Capacity counts Audio objects, and each one
+    also holds the base64 text and adapter conversions made from it, so
+    memory use can be a few times the raw audio size.
+
+    Not thread-safe: AudioCache only touches it from the caller's thread,
+    never from its disk worker threads.
+
+    Usage:
+        memory = MemoryAudioCache(capacity=64)
+        memory.put("abc123", audio)
+        memory.get("abc123")                     # Audio | None
+    """
+
+    def __init__(self, capacity: int = _DEFAULT_MEMORY_CAPACITY) -> None:
+        self.capacity = capacity
+        self._entries: OrderedDict[str, Audio] = OrderedDict()
+
+    def get(self, key: str) -> Audio | None:
+        """Return the cached audio and mark it most recently used."""
+        audio = self._entries.get(key)
+        if audio is not None:
+            self._entries.move_to_end(key)
+        return audio
+
+    def put(self, key: str, audio: Audio) -> None:
+        """Store audio, evicting the least recently used entry when full."""
+        if self.capacity <= 0:
+            return
+        self._entries[key] = audio
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+
+    def discard(self, key: str) -> None:
+        """Drop a single entry if present."""
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
 
 
 class AudioCache:
@@ -27,16 +91,32 @@ class AudioCache:
         <key>.audio  — raw audio bytes
         <key>.meta   — JSON with format, sample_rate, prompt
 
+    Entries loaded from disk are kept in a :class:`MemoryAudioCache` so
+    repeated hits within a process skip the file reads.
+
+    :meth:`aget` and :meth:`aput` run only the disk I/O in a worker thread;
+    the memory layer is always read and updated on the caller's thread, so
+    one instance can be shared by every concurrent run on an event loop
+    without locks. It is not safe to call from several threads at once.
+
     Usage:
         cache = AudioCache()                     # .russo_cache/
         cache = AudioCache(Path("my_cache"))     # custom dir
+        cache = AudioCache(memory_capacity=0)    # disk only
         cache.get("abc123")                      # Audio | None
         cache.put("abc123", audio)
+        await cache.aget("abc123")               # same, without blocking the loop
         cache.clear()
     """
 
-    def __init__(self, cache_dir: Path = _DEFAULT_CACHE_DIR) -> None:
+    def __init__(
+        self,
+        cache_dir: Path = _DEFAULT_CACHE_DIR,
+        *,
+        memory_capacity: int = _DEFAULT_MEMORY_CAPACITY,
+    ) -> None:
         self.cache_dir = cache_dir
+        self.memory = MemoryAudioCache(memory_capacity)
 
     def _ensure_dir(self) -> None:
         self.cache_dir.mkdir(parents=True, exist_ok=True)
@@ -48,40 +128,43 @@ class AudioCache:
         synthesizer config invalidates the cache automatically.
         """
         blob = json.dumps({"prompt": prompt, **extra}, sort_keys=True)
-        return hashlib.sha256(blob.encode()).hexdigest()[:24]
+        return _digest(blob)
 
     def get(self, key: str) -> Audio | None:
         """Load cached audio, or None if not cached."""
-        audio_path = self.cache_dir / f"{key}.audio"
-        meta_path = self.cache_dir / f"{key}.meta"
-        if not audio_path.exists() or not meta_path.exists():
-            return None
-        try:
-            meta = json.loads(meta_path.read_text())
-            data = audio_path.read_bytes()
-            logger.debug("Cache hit: %s", key)
-            return Audio(data=data, format=meta["format"], sample_rate=meta["sample_rate"])
-        except (json.JSONDecodeError, KeyError, OSError) as exc:
-            logger.warning("Corrupt cache entry %s, removing: %s", key, exc)
-            self._remove_entry(key)
-            return None
+        cached = self.memory.get(key)
+        if cached is not None:
+            logger.debug("Memory cache hit: %s", key)
+            return cached
+        audio = self._read(key)
+        if audio is not None:
+            self.memory.put(key, audio)
+        return audio
+
+    async def aget(self, key: str) -> Audio | None:
+        """Like :meth:`get`, but reads from disk in a worker thread."""
+        cached = self.memory.get(key)
+        if cached is not None:
+            logger.debug("Memory cache hit: %s", key)
+            return cached
+        audio = await asyncio.to_thread(self._read, key)
+        if audio is not None:
+            self.memory.put(key, audio)
+        return audio
 
     def put(self, key: str, audio: Audio, *, prompt: str = "") -> None:
         """Write audio + metadata to cache."""
-        self._ensure_dir()
-        audio_path = self.cache_dir / f"{key}.audio"
-        meta_path = self.cache_dir / f"{key}.meta"
-        audio_path.write_bytes(audio.data)
-        meta = {
-            "format": audio.format,
-            "sample_rate": audio.sample_rate,
-            "prompt": prompt,
-        }
-        meta_path.write_text(json.dumps(meta, indent=2))
-        logger.debug("Cached: %s (%d bytes)", key, len(audio.data))
+        self.memory.discard(key)
+        self._write(key, audio, prompt)
+
+    async def aput(self, key: str, audio: Audio, *, prompt: str = "") -> None:
+        """Like :meth:`put`, but writes to disk in a worker thread."""
+        self.memory.discard(key)
+        await asyncio.to_thread(self._write, key, audio, prompt)
 
     def clear(self) -> None:
         """Remove all cached entries."""
+        self.memory.clear()
         if not self.cache_dir.exists():
             return
         count = 0
@@ -97,17 +180,73 @@ class AudioCache:
             return 0
         return sum(1 for f in self.cache_dir.iterdir() if f.suffix == ".audio")
 
+    # Disk helpers below never touch self.memory, so they are safe to run
+    # in a worker thread via aget/aput.
+    def _read(self, key: str) -> Audio | None:
+        audio_path = self.cache_dir / f"{key}.audio"
+        meta_path = self.cache_dir / f"{key}.meta"
+        # Read instead of stat-then-read: a miss costs one failed open.
+        try:
+            meta = _json.loads(meta_path.read_bytes())
+            data = audio_path.read_bytes()
+        except FileNotFoundError:
+            return None
+        except (json.JSONDecodeError, UnicodeDecodeError, OSError) as exc:
+            logger.warning("Corrupt cache entry %s, removing: %s", key, exc)
+            self._remove_entry(key)
+            return None
+        try:
+            logger.debug("Cache hit: %s", key)
+            return Audio(data=data, format=meta["format"], sample_rate=meta["sample_rate"])
+        except (KeyError, TypeError) as exc:
+            logger.warning("Corrupt cache entry %s, removing: %s", key, exc)
+            self._remove_entry(key)
+            return None
+
+    def _write(self, key: str, audio: Audio, prompt: str) -> None:
+        self._ensure_dir()
+        audio_path = self.cache_dir / f"{key}.audio"
+        meta_path = self.cache_dir / f"{key}.meta"
+        meta = {
+            "format": audio.format,
+            "sample_rate": audio.sample_rate,
+            "prompt": prompt,
+        }
+        # Write-then-rename so a concurrent reader never sees a partial file;
+        # meta goes last because _read treats a missing meta as a miss.
+        _atomic_write(audio_path, audio.data)
+        _atomic_write(meta_path, _json.dumps_bytes(meta, indent=True))
+        logger.debug("Cached: %s (%d bytes)", key, len(audio.data))
+
     def _remove_entry(self, key: str) -> None:
         for suffix in (".audio", ".meta"):
             p = self.cache_dir / f"{key}{suffix}"
             p.unlink(missing_ok=True)
 
 
+def _atomic_write(path: Path, data: bytes) -> None:
+    # A unique temp name per write, so concurrent writers of the same key
+    # (threads or xdist workers) never rename each other's half-written file.
+    fd, name = tempfile.mkstemp(dir=path.parent, prefix=f"{path.name}.", suffix=".tmp")
+    tmp = Path(name)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
 class CachedSynthesizer:
     """Wraps any Synthesizer with local audio caching.
 
     Satisfies the Synthesizer protocol — drop-in replacement.
 
+    Concurrent calls for the same uncached prompt (e.g. ``run_concurrent``
+    with ``runs=N``) share a single inner synthesis instead of each paying
+    for their own TTS call.
+
     Usage:
         synth = CachedSynthesizer(GoogleSynthesizer(...))
 
@@ -142,6 +281,7 @@ class CachedSynthesizer:
         self.cache = cache or AudioCache()
         self.enabled = enabled
         self.cache_key_extra = cache_key_extra or {}
+        self._inflight: dict[str, asyncio.Task[Audio]] = {}
 
     async def synthesize(self, text: str) -> Audio:
         """Synthesize with cache lookup/store."""
@@ -149,10 +289,24 @@ class CachedSynthesizer:
             return await self.inner.synthesize(text)
 
         key = self.cache.cache_key(text, **self.cache_key_extra)
-        cached = self.cache.get(key)
+        cached = await self.cache.aget(key)
         if cached is not None:
             return cached
 
-        audio = await self.inner.synthesize(text)
-        self.cache.put(key, audio, prompt=text)
-        return audio
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._synthesize_and_store(key, text))
+            self._inflight[key] = task
+        # Shielded so one caller being cancelled doesn't cancel the others.
+        return await asyncio.shield(task)
+
+    async def _synthesize_and_store(self, key: str, text: str) -> Audio:
+        # Unregister before the task finishes, so a caller arriving after a
+        # failure starts a new synthesis instead of joining the failed one.
+        try:
+            audio = await self.inner.synthesize(text)
+            await self.cache.aput(key, audio, prompt=text)
+            self.cache.memory.put(key, audio)
+            return audio
+        finally:
+            self._inflight.pop(key, None)
@@ -0,0 +1,40 @@
+"""JSON encode/decode helpers.
+
+Uses ``orjson`` when it is installed (``pip install russo[fast]``) and falls
+back to the standard library otherwise. ``orjson.JSONDecodeError`` subclasses
+``json.JSONDecodeError``, so callers can keep catching the stdlib exception.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
+
+def loads(data: str | bytes) -> Any:
+    """Decode a JSON document from text or UTF-8 bytes."""
+    if _HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> str:
+    """Encode *obj* as compact JSON text."""
+    if _HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(obj)
+
+
+def dumps_bytes(obj: Any, *, indent: bool = False) -> bytes:
+    """Encode *obj* as UTF-8 JSON bytes, optionally indented by two spaces."""
+    if _HAS_ORJSON:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=2 if indent else None).encode("utf-8")
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 
 from russo._protocols import Agent, Evaluator, Synthesizer
 from russo._types import BatchResult, EvalResult, SingleRunResult, ToolCall
@@ -32,8 +33,39 @@ async def run(
     Returns:
         EvalResult with pass/fail and per-call match details.
     """
-    audio = await synthesizer.synthesize(prompt)
-    response = await agent.run(audio)
+    return await _run_stages(
+        prompt=prompt,
+        synthesizer=synthesizer,
+        agent=agent,
+        evaluator=evaluator,
+        expect=expect,
+    )
+
+
+async def _run_stages(
+    *,
+    prompt: str,
+    synthesizer: Synthesizer,
+    agent: Agent,
+    evaluator: Evaluator,
+    expect: list[ToolCall],
+    synth_slots: asyncio.Semaphore | None = None,
+    agent_slots: asyncio.Semaphore | None = None,
+) -> EvalResult:
+    """Synthesize, call the agent and evaluate, optionally gated by slots.
+
+    The synthesis slot is kept until an agent slot frees up, so at most
+    as many synthesized clips as there are synthesis slots wait in memory.
+    """
+    async with synth_slots or contextlib.nullcontext():
+        audio = await synthesizer.synthesize(prompt)
+        if agent_slots is not None:
+            await agent_slots.acquire()
+    try:
+        response = await agent.run(audio)
+    finally:
+        if agent_slots is not None:
+            agent_slots.release()
     return evaluator.evaluate(expected=expect, actual=response.tool_calls)
 
 
@@ -61,32 +93,42 @@ async def run_concurrent(
         evaluator: Compares expected vs actual tool calls.
         expect: The expected tool calls (same for every prompt).
         runs: Number of times to run each prompt (default 1).
-        max_concurrency: Cap on simultaneous pipeline runs (``None`` = unlimited).
+        max_concurrency: Cap on simultaneous synthesizer calls and, separately, on
+            simultaneous agent calls (``None`` = unlimited). Synthesis for queued
+            runs overlaps with agent calls already in flight.
 
     Returns:
         BatchResult with per-run details and aggregate statistics.
+
+    Raises:
+        Exception: The first error raised by a run, as is. The remaining
+            runs are cancelled rather than left running in the background.
     """
     if isinstance(prompts, str):
         prompts = [prompts]
 
-    semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+    # Synthesis and agent calls are capped separately so that, once every
+    # agent slot is busy, the next runs can already be synthesizing.
+    synth_slots = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+    agent_slots = asyncio.Semaphore(max_concurrency) if max_concurrency else None
 
     async def _single_run(prompt: str, run_index: int) -> SingleRunResult:
-        async def _do() -> SingleRunResult:
-            result = await run(
-                prompt=prompt,
-                synthesizer=synthesizer,
-                agent=agent,
-                evaluator=evaluator,
-                expect=expect,
-            )
-            return SingleRunResult(prompt=prompt, run_index=run_index, eval_result=result)
-
-        if semaphore:
-            async with semaphore:
-                return await _do()
-        return await _do()
-
-    tasks = [_single_run(prompt, i) for prompt in prompts for i in range(runs)]
-    results = await asyncio.gather(*tasks)
-    return BatchResult(runs=list(results))
+        result = await _run_stages(
+            prompt=prompt,
+            synthesizer=synthesizer,
+            agent=agent,
+            evaluator=evaluator,
+            expect=expect,
+            synth_slots=synth_slots,
+            agent_slots=agent_slots,
+        )
+        return SingleRunResult(prompt=prompt, run_index=run_index, eval_result=result)
+
+    try:
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(_single_run(prompt, i)) for prompt in prompts for i in range(runs)]
+    except ExceptionGroup as eg:
+        # Raise the run's own error, as asyncio.gather did, so callers'
+        # ``except SomeError`` keeps matching.
+        raise eg.exceptions[0] from None
+    return BatchResult(runs=[task.result() for task in tasks])
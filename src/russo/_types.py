@@ -6,14 +6,40 @@ giving us validation, serialization, and rich repr for free.
 
 from __future__ import annotations
 
+import binascii
+from functools import cached_property
 from pathlib import Path
 from typing import Any, Literal
 
 from pydantic import BaseModel, Field
 
+try:
+    import pybase64
+
+    _HAS_PYBASE64 = True
+except ImportError:
+    _HAS_PYBASE64 = False
+
+
+def _b64encode(data: bytes) -> str:
+    """Base64-encode *data* as text, with SIMD ``pybase64`` when installed (``pip install russo[fast]``)."""
+    if _HAS_PYBASE64:
+        return pybase64.b64encode(data).decode("ascii")
+    return binascii.b2a_base64(data, newline=False).decode("ascii")
+
+
+_AUDIO_MEMO_KEYS = ("_base64", "_prepared")
+"""Per-instance memos Audio keeps in ``__dict__``; never copied or pickled."""
+
 
 class Audio(BaseModel):
-    """Audio data with format metadata."""
+    """Audio data with format metadata.
+
+    An instance memoizes its base64 text and adapter conversions (see
+    :attr:`base64` and ``AudioManager.prepare_for_*``), so an Audio that has
+    been sent can hold a few times the memory of its raw ``data``. The memos
+    are dropped from copies and pickles.
+    """
 
     data: bytes
     format: Literal["wav", "mp3", "pcm", "ogg"] = "wav"
@@ -21,29 +47,73 @@ class Audio(BaseModel):
     channels: int = 1
     sample_width: int = 2  # bytes per sample (16-bit = 2)
 
+    @property
+    def base64(self) -> str:
+        """The audio bytes as base64 text.
+
+        Encoded on first access and kept on the instance, so an Audio reused
+        across runs (e.g. from the audio cache) is only encoded once. The memo
+        is tied to the ``data`` object itself, so reassigning ``data`` or
+        ``model_copy(update={"data": ...})`` re-encodes. Uses the
+        SIMD-accelerated ``pybase64`` when installed (``pip install russo[fast]``).
+        """
+        # Kept in __dict__ like a cached_property, so it stays out of
+        # equality, repr and serialization.
+        cached = self.__dict__.get("_base64")
+        if cached is None or cached[0] is not self.data:
+            cached = self.__dict__["_base64"] = (self.data, _b64encode(self.data))
+        return cached[1]
+
+    @cached_property
+    def _prepared(self) -> dict[str, Any]:
+        """Adapter-ready conversions of this audio, filled in by AudioManager."""
+        return {}
+
+    def __copy__(self) -> Audio:
+        copied = super().__copy__()
+        _drop_memos(copied.__dict__)
+        return copied
+
+    def __deepcopy__(self, memo: dict[int, Any] | None = None) -> Audio:
+        copied = super().__deepcopy__(memo)
+        _drop_memos(copied.__dict__)
+        return copied
+
+    def __getstate__(self) -> dict[Any, Any]:
+        state = super().__getstate__()
+        state["__dict__"] = {k: v for k, v in state["__dict__"].items() if k not in _AUDIO_MEMO_KEYS}
+        return state
+
     def save(self, path: str | Path) -> Path:
         """Save audio to a file. Wraps raw PCM in a WAV container if needed.
 
         Usage:
             audio.save("output.wav")
         """
-        import wave
+        from russo.audio.manager import AudioManager
 
         p = Path(path)
         p.parent.mkdir(parents=True, exist_ok=True)
 
         if p.suffix.lower() == ".wav":
-            with wave.open(str(p), "wb") as wf:
-                wf.setnchannels(self.channels)
-                wf.setsampwidth(self.sample_width)
-                wf.setframerate(self.sample_rate)
-                wf.writeframes(self.data)
+            wav = AudioManager.pcm_to_wav(
+                self.data,
+                sample_rate=self.sample_rate,
+                channels=self.channels,
+                sample_width=self.sample_width,
+            )
+            p.write_bytes(wav)
         else:
             # For non-WAV formats, write raw bytes
             p.write_bytes(self.data)
         return p
 
 
+def _drop_memos(instance_dict: dict[str, Any]) -> None:
+    for key in _AUDIO_MEMO_KEYS:
+        instance_dict.pop(key, None)
+
+
 class ToolCall(BaseModel):
     """A normalized tool/function call representation.
 
@@ -59,7 +129,7 @@ class ToolCall(BaseModel):
         return self.name == other.name and self.arguments == other.arguments
 
     def __hash__(self) -> int:
-        return hash((self.name, tuple(sorted(self.arguments.items()))))
+        return hash((self.name, frozenset(self.arguments.items())))
 
 
 class AgentResponse(BaseModel):
@@ -94,7 +164,7 @@ class EvalResult(BaseModel):
         """Fraction of expected tool calls that matched."""
         if not self.expected:
             return 1.0
-        matched = sum(1 for m in self.matches if m.matched)
+        matched = sum(m.matched for m in self.matches)
         return matched / len(self.expected)
 
     def summary(self) -> str:
@@ -135,7 +205,7 @@ class BatchResult(BaseModel):
 
     @property
     def passed_count(self) -> int:
-        return sum(1 for r in self.runs if r.eval_result.passed)
+        return sum(r.eval_result.passed for r in self.runs)
 
     @property
     def failed_count(self) -> int:
@@ -162,10 +232,14 @@ class BatchResult(BaseModel):
 
     def summary(self) -> str:
         """Human-readable summary grouped by prompt."""
-        status = "PASSED" if self.passed else "FAILED"
+        # Count passes once; passed/pass_rate/passed_count would each rescan runs.
+        total = self.total
+        passed = self.passed_count
+        status = "PASSED" if passed == total else "FAILED"
+        pass_rate = passed / total if total else 1.0
         lines = [
-            f"{status} ({self.pass_rate:.0%} pass rate, {self.total} runs)",
-            f"  Passed: {self.passed_count}/{self.total}",
+            f"{status} ({pass_rate:.0%} pass rate, {total} runs)",
+            f"  Passed: {passed}/{total}",
         ]
 
         prompts: dict[str, list[SingleRunResult]] = {}
@@ -173,7 +247,7 @@ class BatchResult(BaseModel):
             prompts.setdefault(r.prompt, []).append(r)
 
         for prompt, results in prompts.items():
-            prompt_passed = sum(1 for r in results if r.eval_result.passed)
+            prompt_passed = sum(r.eval_result.passed for r in results)
             lines.append(f"  Prompt: {prompt!r}")
             lines.append(f"    {prompt_passed}/{len(results)} passed")
             for r in results:
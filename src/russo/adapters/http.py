@@ -2,20 +2,36 @@
 
 from __future__ import annotations
 
-import base64
-import json
+import asyncio
+import logging
 from typing import Any
-from urllib.request import Request, urlopen
 
+import httpx
+
+from russo import _json
 from russo._protocols import ResponseParser
 from russo._types import AgentResponse, Audio
 
+logger = logging.getLogger("russo.adapters.http")
+
 
 class HttpAgent:
     """Agent adapter that sends audio to an HTTP endpoint.
 
     Sends audio as base64-encoded JSON and parses the response
-    using an optional ResponseParser.
+    using an optional ResponseParser. With ``send_bytes=True`` the raw
+    audio is posted as the request body instead (``Content-Type:
+    audio/<format>``), which skips base64 and JSON for endpoints that
+    accept it.
+
+    Requests go through one pooled ``httpx.AsyncClient``, so concurrent
+    runs reuse keep-alive connections instead of reconnecting every time.
+    Redirects are followed. Close the agent's own pool with ``aclose()`` or
+    ``async with``; nested ``async with`` blocks close it only when the
+    outermost one exits. An agent reused under a new event loop starts a
+    new pool there and drops the old one, whose connections can't be
+    closed from another loop. Pass your own ``client`` to control pooling,
+    HTTP/2, proxies, etc.
 
     Usage:
         agent = HttpAgent(
@@ -23,6 +39,16 @@ class HttpAgent:
             parser=russo.parsers.GeminiResponseParser(),
         )
         response = await agent.run(audio)
+
+        # Raw audio body instead of base64 JSON
+        agent = HttpAgent(url="http://localhost:8000/voice-agent", send_bytes=True)
+
+        # Shared client with HTTP/2 (requires the ``h2`` package)
+        agent = HttpAgent(url=..., client=httpx.AsyncClient(http2=True))
+
+        # Close the agent's own pool when done
+        async with HttpAgent(url=...) as agent:
+            await russo.run_concurrent(prompts=[...], agent=agent, ...)
     """
 
     def __init__(
@@ -32,46 +58,88 @@ class HttpAgent:
         parser: ResponseParser | None = None,
         method: str = "POST",
         headers: dict[str, str] | None = None,
+        send_bytes: bool = False,
         audio_field: str = "audio",
         format_field: str = "format",
         timeout: float = 60.0,
+        client: httpx.AsyncClient | None = None,
     ) -> None:
         self.url = url
         self.parser = parser
         self.method = method
         self.headers = headers or {}
+        self.send_bytes = send_bytes
         self.audio_field = audio_field
         self.format_field = format_field
         self.timeout = timeout
+        self._client = client
+        self._owns_client = client is None
+        self._client_loop: asyncio.AbstractEventLoop | None = None
+        self._entered = 0
 
     async def run(self, audio: Audio) -> AgentResponse:
         """Send audio to the HTTP endpoint and parse the response."""
-        payload = {
-            self.audio_field: base64.b64encode(audio.data).decode("ascii"),
-            self.format_field: audio.format,
-        }
-
-        raw_response = await self._send(payload)
+        if self.send_bytes:
+            raw_response = await self._send(audio.data, content_type=f"audio/{audio.format}")
+        else:
+            payload = {
+                self.audio_field: audio.base64,
+                self.format_field: audio.format,
+            }
+            raw_response = await self._send(_json.dumps_bytes(payload), content_type="application/json")
 
         if self.parser:
             return self.parser.parse(raw_response)
 
         return self._default_parse(raw_response)
 
-    async def _send(self, payload: dict[str, Any]) -> Any:
-        """Send the HTTP request. Uses stdlib urllib for zero extra deps."""
-        import asyncio
-
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self._send_sync, payload)
-
-    def _send_sync(self, payload: dict[str, Any]) -> Any:
-        """Synchronous HTTP send."""
-        data = json.dumps(payload).encode("utf-8")
-        headers = {"Content-Type": "application/json", **self.headers}
-        req = Request(self.url, data=data, headers=headers, method=self.method)
-        with urlopen(req, timeout=self.timeout) as resp:  # noqa: S310
-            return json.loads(resp.read().decode("utf-8"))
+    async def _send(self, body: bytes, *, content_type: str) -> Any:
+        """Send the HTTP request over the pooled client."""
+        response = await self._get_client().request(
+            self.method,
+            self.url,
+            content=body,
+            headers={"Content-Type": content_type, **self.headers},
+            timeout=self.timeout,
+        )
+        response.raise_for_status()
+        return _json.loads(response.content)
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the pooled client, creating one for the running event loop if needed."""
+        if not self._owns_client:
+            assert self._client is not None
+            return self._client
+        # Pooled connections are bound to the loop that opened them, so an
+        # agent reused under a new loop (e.g. another asyncio.run) needs a new pool.
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop:
+            if self._client is not None:
+                logger.debug("Event loop changed, dropping the previous HTTP client")
+            # follow_redirects matches the urllib behavior HttpAgent had before httpx.
+            self._client = httpx.AsyncClient(follow_redirects=True)
+            self._client_loop = loop
+        return self._client
+
+    async def __aenter__(self) -> HttpAgent:
+        self._entered += 1
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        self._entered -= 1
+        if self._entered == 0:
+            await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the pooled client if this agent created it."""
+        if not self._owns_client or self._client is None:
+            return
+        client, loop = self._client, self._client_loop
+        self._client = None
+        self._client_loop = None
+        # A pool opened on another loop can't be closed from this one.
+        if loop is asyncio.get_running_loop():
+            await client.aclose()
 
     def _default_parse(self, raw: Any) -> AgentResponse:
         """Fallback parser: expects {"tool_calls": [{"name": ..., "arguments": ...}]}."""
@@ -13,12 +13,11 @@ Requires the ``openai`` package: ``pip install russo[openai]``
 from __future__ import annotations
 
 import asyncio
-import base64
-import json
 import logging
 from typing import Any
 
-from russo._types import AgentResponse, Audio, ToolCall
+from russo import _json
+from russo._types import AgentResponse, Audio, ToolCall, _b64encode
 from russo.audio import AudioManager
 from russo.parsers.openai import OpenAIResponseParser
 
@@ -77,7 +76,7 @@ class OpenAIAgent:
 
     async def run(self, audio: Audio) -> AgentResponse:
         """Send audio via Chat Completions and parse the tool-call response."""
-        audio_b64 = base64.b64encode(audio.data).decode("ascii")
+        audio_b64 = audio.base64
 
         messages: list[dict[str, Any]] = []
         if self.system_prompt:
@@ -194,7 +193,7 @@ class OpenAIRealtimeAgent:
             await conn.session.update(session={"tools": self.tools})
 
         pcm_data = AudioManager.prepare_for_openai_realtime(audio)
-        audio_b64 = base64.b64encode(pcm_data).decode("ascii")
+        audio_b64 = _b64encode(pcm_data)
 
         await conn.input_audio_buffer.append(audio=audio_b64)
         await conn.input_audio_buffer.commit()
@@ -213,7 +212,7 @@ class OpenAIRealtimeAgent:
                 async for event in conn:
                     raw_events.append(event)
                     if event.type == "response.function_call_arguments.done":
-                        args = json.loads(event.arguments) if event.arguments else {}
+                        args = _json.loads(event.arguments) if event.arguments else {}
                         tool_calls.append(ToolCall(name=event.name, arguments=args))
                     elif event.type == "response.done":
                         break
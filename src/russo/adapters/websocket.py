@@ -6,12 +6,14 @@ Requires the `websockets` package: pip install russo[ws]
 from __future__ import annotations
 
 import asyncio
-import base64
+import itertools
 import json
 import logging
-from collections.abc import Callable
+from collections.abc import AsyncIterator, Callable
+from contextlib import aclosing
 from typing import Any
 
+from russo import _json
 from russo._protocols import ResponseParser
 from russo._types import AgentResponse, Audio, ToolCall
 
@@ -24,6 +26,9 @@ try:
 except ImportError:
     _HAS_WEBSOCKETS = False
 
+_CLOSED = object()
+"""Queued to routed runs when the shared connection goes away."""
+
 
 class WebSocketAgent:
     """Agent adapter that communicates over WebSocket.
@@ -37,7 +42,25 @@ class WebSocketAgent:
 
     And two ways to customize the protocol:
     - **on_send**: transform the Audio into whatever your server expects
-    - **is_complete**: decide when to stop collecting response messages
+    - **is_complete**: decide when to stop collecting response messages.
+      It is called after every received message with the list so far, so
+      checking the newest message (``msgs[-1]``) avoids rescanning history.
+
+    By default every ``run()`` opens its own connection. Use the agent as an
+    async context manager to keep one connection open across runs instead;
+    runs on a shared connection take turns, since replies on one socket
+    can't be told apart. The server must accept several requests per
+    connection for this mode. Entering an agent that is already open
+    reuses its connection; it is closed when the outermost block exits.
+
+    If the server echoes a request id, set ``request_id_field``: every JSON
+    message then carries ``{request_id_field: n}``, and on a shared
+    connection replies are routed back to their run by that field, so runs
+    no longer take turns. The id may come back as a number or a string
+    (``1`` or ``"1"``); messages without a known id are dropped.
+    Without ``request_id_field``, a run that times out or stops at
+    ``max_messages`` closes the shared connection, so replies it left
+    behind can't be read by the next run; that run reconnects.
 
     Usage:
         # Simple JSON protocol
@@ -56,8 +79,12 @@ class WebSocketAgent:
         agent = WebSocketAgent(
             url="ws://localhost:8000/ws/agent",
             on_send=lambda audio: json.dumps({"pcm": base64.b64encode(audio.data).decode()}),
-            is_complete=lambda msgs: any('"done": true' in str(m) for m in msgs),
+            is_complete=lambda msgs: '"done": true' in str(msgs[-1]),
         )
+
+        # One connection for a whole batch
+        async with WebSocketAgent(url="ws://localhost:8000/ws/agent") as agent:
+            await russo.run_concurrent(prompts=[...], agent=agent, ...)
     """
 
     def __init__(
@@ -77,6 +104,7 @@ class WebSocketAgent:
         on_send: Callable[[Audio], str | bytes] | None = None,
         is_complete: Callable[[list[Any]], bool] | None = None,
         aggregate: Callable[[list[Any]], Any] | None = None,
+        request_id_field: str | None = None,
         # Connection
         open_timeout: float = 10.0,
         close_timeout: float = 5.0,
@@ -85,6 +113,9 @@ class WebSocketAgent:
         if not _HAS_WEBSOCKETS:
             msg = "WebSocketAgent requires the 'websockets' package. Install with: pip install russo[ws]"
             raise ImportError(msg)
+        if request_id_field is not None and (send_bytes or on_send is not None):
+            msg = "request_id_field requires the default JSON send mode (no send_bytes or on_send)"
+            raise ValueError(msg)
 
         self.url = url
         self.parser = parser
@@ -97,67 +128,182 @@ class WebSocketAgent:
         self.on_send = on_send
         self.is_complete = is_complete
         self.aggregate = aggregate
+        self.request_id_field = request_id_field
         self.open_timeout = open_timeout
         self.close_timeout = close_timeout
         self.extra_ws_kwargs = extra_ws_kwargs or {}
+        self._ws: Any | None = None
+        self._ws_lock = asyncio.Lock()
+        self._request_ids = itertools.count(1)
+        self._waiters: dict[str, asyncio.Queue[Any]] = {}
+        self._reader: asyncio.Task[None] | None = None
+        self._entered = 0
+
+    async def __aenter__(self) -> WebSocketAgent:
+        if self._entered == 0:
+            await self._open_shared()
+        self._entered += 1
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        self._entered -= 1
+        if self._entered > 0:
+            return
+        ws, self._ws = self._ws, None
+        if ws is not None:
+            await ws.close()
+        if self._reader is not None:
+            self._reader.cancel()
+            await asyncio.gather(self._reader, return_exceptions=True)
+            self._reader = None
 
     async def run(self, audio: Audio) -> AgentResponse:
         """Send audio over WebSocket and collect the response."""
+        if self._ws is not None and self.request_id_field is not None:
+            messages = await self._exchange_routed(audio)
+        elif self._ws is not None:
+            async with self._ws_lock:
+                if self._ws.close_code is not None:
+                    logger.debug("Persistent connection closed, reconnecting")
+                    await self._open_shared()
+                messages, complete = await self._exchange(self._ws, audio)
+                if not complete:
+                    # Late or surplus replies would be read by the next run.
+                    logger.debug("Response incomplete, closing persistent connection")
+                    await self._ws.close()
+        else:
+            async with await self._connect() as ws:
+                messages, _ = await self._exchange(ws, audio)
+
+        # --- Parse ---
+        raw = self._aggregate(messages)
+
+        if self.parser:
+            return self.parser.parse(raw)
+        return self._default_parse(raw)
+
+    async def _connect(self) -> Any:
         import websockets
 
-        async with websockets.connect(
+        return await websockets.connect(
             self.url,
             additional_headers=self.headers or None,
             open_timeout=self.open_timeout,
             close_timeout=self.close_timeout,
             **self.extra_ws_kwargs,
-        ) as ws:
-            # --- Send ---
-            message = self._prepare_message(audio)
-            if isinstance(message, bytes):
-                await ws.send(message)
-            else:
-                await ws.send(message)
-            logger.debug(
-                "Sent %s message (%d bytes)",
-                "binary" if isinstance(message, bytes) else "text",
-                len(message),
-            )
+        )
 
-            # --- Collect responses ---
-            messages = await self._collect_responses(ws)
-            logger.debug("Collected %d response messages", len(messages))
+    async def _open_shared(self) -> None:
+        """(Re)open the shared connection and, when routing by id, its reader task."""
+        self._ws = await self._connect()
+        if self.request_id_field is not None:
+            self._waiters = {}
+            self._reader = asyncio.create_task(self._route_incoming(self._ws, self._waiters))
 
-        # --- Parse ---
-        raw = self._aggregate(messages)
+    async def _exchange(self, ws: Any, audio: Audio) -> tuple[list[Any], bool]:
+        """Send one audio message and collect its responses on an open connection.
 
-        if self.parser:
-            return self.parser.parse(raw)
-        return self._default_parse(raw)
+        Returns the messages and whether the response ended cleanly (see
+        :meth:`_collect_responses`).
+        """
+        request_id = next(self._request_ids) if self.request_id_field is not None else None
+        await self._send(ws, self._prepare_message(audio, request_id))
+
+        async with aclosing(self._incoming(ws)) as incoming:
+            messages, complete = await self._collect_responses(incoming)
+        logger.debug("Collected %d response messages", len(messages))
+        return messages, complete
+
+    async def _exchange_routed(self, audio: Audio) -> list[Any]:
+        """Send on the shared connection and collect the replies routed to this request's id."""
+        request_id = next(self._request_ids)
+        queue: asyncio.Queue[Any] = asyncio.Queue()
+        async with self._ws_lock:
+            if self._ws.close_code is not None:
+                logger.debug("Persistent connection closed, reconnecting")
+                await self._open_shared()
+            waiters = self._waiters
+            waiters[str(request_id)] = queue
+            await self._send(self._ws, self._prepare_message(audio, request_id))
+
+        try:
+            async with aclosing(self._drain(queue)) as incoming:
+                messages, _ = await self._collect_responses(incoming)
+        finally:
+            waiters.pop(str(request_id), None)
+        logger.debug("Collected %d response messages for request %d", len(messages), request_id)
+        return messages
+
+    async def _send(self, ws: Any, message: str | bytes) -> None:
+        # Default JSON messages are already UTF-8 bytes; sending them as a text
+        # frame skips decoding to str and websockets re-encoding it.
+        text = isinstance(message, str) or (self.on_send is None and not self.send_bytes)
+        await ws.send(message, text=text)
+        logger.debug("Sent %s message (%d bytes)", "text" if text else "binary", len(message))
 
-    def _prepare_message(self, audio: Audio) -> str | bytes:
+    async def _route_incoming(self, ws: Any, waiters: dict[str, asyncio.Queue[Any]]) -> None:
+        """Dispatch messages on a shared connection to the run waiting on their request id."""
+        import websockets
+
+        try:
+            async for msg in ws:
+                parsed = self._parse_incoming(msg)
+                request_id = parsed.get(self.request_id_field) if isinstance(parsed, dict) else None
+                # Waiters are keyed by str(id), so an id echoed back as "1"
+                # still matches; ids of any other type can't be ours.
+                if request_id is not None and not isinstance(request_id, int | str):
+                    logger.warning("Dropping message with unsupported request id %r", request_id)
+                    continue
+                queue = waiters.get(str(request_id)) if request_id is not None else None
+                if queue is None:
+                    logger.debug("Dropping message for unknown request id %r", request_id)
+                    continue
+                queue.put_nowait(parsed)
+        except websockets.ConnectionClosed:
+            pass
+        finally:
+            for queue in waiters.values():
+                queue.put_nowait(_CLOSED)
+
+    async def _incoming(self, ws: Any) -> AsyncIterator[Any]:
+        async for msg in ws:
+            yield self._parse_incoming(msg)
+
+    @staticmethod
+    async def _drain(queue: asyncio.Queue[Any]) -> AsyncIterator[Any]:
+        while (item := await queue.get()) is not _CLOSED:
+            yield item
+
+    def _prepare_message(self, audio: Audio, request_id: int | None = None) -> str | bytes:
         """Build the outgoing message."""
         if self.on_send:
             return self.on_send(audio)
         if self.send_bytes:
             return audio.data
-        return json.dumps(
-            {
-                self.audio_field: base64.b64encode(audio.data).decode("ascii"),
-                self.format_field: audio.format,
-            }
-        )
+        payload: dict[str, Any] = {
+            self.audio_field: audio.base64,
+            self.format_field: audio.format,
+        }
+        if request_id is not None:
+            payload[self.request_id_field] = request_id
+        return _json.dumps_bytes(payload)
 
-    async def _collect_responses(self, ws: Any) -> list[Any]:
-        """Read messages until completion condition or timeout."""
+    async def _collect_responses(self, incoming: AsyncIterator[Any]) -> tuple[list[Any], bool]:
+        """Read parsed messages until completion condition or timeout.
+
+        Returns the messages and whether the response ended cleanly: False
+        after a timeout or the ``max_messages`` cutoff, when more replies to
+        this request may still arrive.
+        """
         messages: list[Any] = []
+        complete = False
         try:
             async with asyncio.timeout(self.response_timeout):
-                async for msg in ws:
-                    parsed = self._parse_incoming(msg)
+                async for parsed in incoming:
                     messages.append(parsed)
 
                     if self.is_complete and self.is_complete(messages):
+                        complete = True
                         break
                     if len(messages) >= self.max_messages:
                         logger.warning(
@@ -168,6 +314,7 @@ class WebSocketAgent:
 
                     # If no is_complete hook, take only the first message
                     if not self.is_complete:
+                        complete = True
                         break
         except TimeoutError:
             if not messages:
@@ -181,18 +328,13 @@ class WebSocketAgent:
                     self.response_timeout,
                     len(messages),
                 )
-        return messages
+        return messages, complete
 
     def _parse_incoming(self, msg: str | bytes) -> Any:
         """Try to JSON-parse an incoming message, fall back to raw."""
-        if isinstance(msg, bytes):
-            try:
-                return json.loads(msg.decode("utf-8"))
-            except (json.JSONDecodeError, UnicodeDecodeError):
-                return msg
         try:
-            return json.loads(msg)
-        except json.JSONDecodeError:
+            return _json.loads(msg)
+        except (json.JSONDecodeError, UnicodeDecodeError):
             return msg
 
     def _aggregate(self, messages: list[Any]) -> Any:
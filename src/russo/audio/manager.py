@@ -2,13 +2,52 @@
 
 from __future__ import annotations
 
+import functools
 import io
 import struct
 import wave
+from collections.abc import Callable
+from typing import TypeVar
 
 from russo._types import Audio
 from russo.audio.constants import AudioMime, Gemini, OpenAI
 
+try:
+    import numpy as np
+
+    _HAS_NUMPY = True
+except ImportError:
+    _HAS_NUMPY = False
+
+# RIFF chunk, "fmt " sub-chunk (16-byte PCM format block), "data" sub-chunk header.
+_WAV_HEADER = struct.Struct("<4sI4s4sIHHIIHH4sI")
+
+_T = TypeVar("_T")
+
+
+def _per_audio(prepare: Callable[[Audio], _T]) -> Callable[[Audio], _T]:
+    """Memoize an adapter conversion on the Audio instance it was computed for.
+
+    The same Audio is often sent many times (``runs=N``, cache hits), and the
+    conversions — WAV wrapping, header stripping, pure-Python resampling —
+    always give the same result for it. Each entry remembers the ``data``
+    object and format fields it was computed from, so an Audio whose fields
+    were reassigned is converted again instead of getting a stale result.
+    Copies and pickles start with no entries. The converted bytes live as
+    long as the Audio does, including in the audio cache's memory layer.
+    """
+    key = prepare.__name__
+
+    @functools.wraps(prepare)
+    def wrapper(audio: Audio) -> _T:
+        params = (audio.format, audio.sample_rate, audio.channels, audio.sample_width)
+        cached = audio._prepared.get(key)
+        if cached is None or cached[0] is not audio.data or cached[1] != params:
+            cached = audio._prepared[key] = (audio.data, params, prepare(audio))
+        return cached[2]
+
+    return wrapper
+
 
 class AudioManager:
     """Centralized audio processing for adapter input preparation."""
@@ -16,7 +55,28 @@ class AudioManager:
     @staticmethod
     def has_wav_header(data: bytes) -> bool:
         """True if data starts with a RIFF/WAV header."""
-        return len(data) >= 4 and data[:4] == b"RIFF"
+        return data.startswith(b"RIFF")
+
+    @staticmethod
+    def pcm_to_wav(pcm: bytes, *, sample_rate: int, channels: int = 1, sample_width: int = 2) -> bytes:
+        """Wrap raw PCM frames in a 44-byte WAV header (same bytes ``wave`` writes)."""
+        block_align = channels * sample_width
+        header = _WAV_HEADER.pack(
+            b"RIFF",
+            36 + len(pcm),
+            b"WAVE",
+            b"fmt ",
+            16,
+            1,  # WAVE_FORMAT_PCM
+            channels,
+            sample_rate,
+            sample_rate * block_align,
+            block_align,
+            sample_width * 8,
+            b"data",
+            len(pcm),
+        )
+        return header + pcm
 
     @staticmethod
     def extract_pcm(audio: Audio) -> bytes:
@@ -28,11 +88,18 @@ class AudioManager:
 
     @staticmethod
     def resample_pcm_16bit(pcm: bytes, from_rate: int, to_rate: int) -> bytes:
-        """Resample 16-bit little-endian PCM (linear interpolation)."""
+        """Resample 16-bit little-endian PCM (linear interpolation).
+
+        Vectorized with NumPy when installed (``pip install russo[fast]``);
+        both paths produce identical samples. A trailing odd byte (half a
+        sample) is ignored.
+        """
         if from_rate == to_rate:
             return pcm
+        if _HAS_NUMPY:
+            return _resample_pcm_16bit_numpy(pcm, from_rate, to_rate)
         n_in = len(pcm) // 2
-        samples = struct.unpack(f"<{n_in}h", pcm)
+        samples = struct.unpack_from(f"<{n_in}h", pcm)
         n_out = int(round(n_in * to_rate / from_rate))
         if n_out == 0:
             return b""
@@ -47,6 +114,7 @@ class AudioManager:
         return struct.pack(f"<{len(out)}h", *out)
 
     @staticmethod
+    @_per_audio
     def prepare_for_generate_content(audio: Audio) -> tuple[bytes, str]:
         """Return (bytes, mime_type) for Gemini generate_content API.
 
@@ -54,17 +122,18 @@ class AudioManager:
         """
         if audio.format == "wav":
             if not AudioManager.has_wav_header(audio.data):
-                buf = io.BytesIO()
-                with wave.open(buf, "wb") as wf:
-                    wf.setnchannels(audio.channels)
-                    wf.setsampwidth(audio.sample_width)
-                    wf.setframerate(audio.sample_rate)
-                    wf.writeframes(audio.data)
-                return buf.getvalue(), "audio/wav"
+                wav = AudioManager.pcm_to_wav(
+                    audio.data,
+                    sample_rate=audio.sample_rate,
+                    channels=audio.channels,
+                    sample_width=audio.sample_width,
+                )
+                return wav, "audio/wav"
             return audio.data, "audio/wav"
         return audio.data, AudioMime.for_format(audio.format)
 
     @staticmethod
+    @_per_audio
     def prepare_for_live(audio: Audio) -> tuple[bytes, str]:
         """Return (pcm_bytes, mime_type) for Gemini Live API — 16 kHz PCM required."""
         pcm = AudioManager.extract_pcm(audio)
@@ -73,9 +142,26 @@ class AudioManager:
         return pcm, Gemini.LIVE_INPUT_MIME
 
     @staticmethod
+    @_per_audio
     def prepare_for_openai_realtime(audio: Audio) -> bytes:
         """Return PCM bytes for OpenAI Realtime API — 24 kHz mono required."""
         pcm = AudioManager.extract_pcm(audio)
         if audio.sample_rate != OpenAI.REALTIME_INPUT_SAMPLE_RATE:
             pcm = AudioManager.resample_pcm_16bit(pcm, audio.sample_rate, OpenAI.REALTIME_INPUT_SAMPLE_RATE)
         return pcm
+
+
+def _resample_pcm_16bit_numpy(pcm: bytes, from_rate: int, to_rate: int) -> bytes:
+    """NumPy version of the interpolation loop in ``resample_pcm_16bit``."""
+    samples = np.frombuffer(pcm, dtype="<i2", count=len(pcm) // 2)
+    n_in = len(samples)
+    n_out = int(round(n_in * to_rate / from_rate))
+    if n_out == 0:
+        return b""
+    src_idx = np.arange(n_out, dtype=np.int64) * from_rate / to_rate
+    whole = np.trunc(src_idx)
+    lo = whole.astype(np.int64) % n_in
+    hi = np.minimum(lo + 1, n_in - 1)
+    frac = src_idx - whole
+    out = samples[lo] * (1 - frac) + samples[hi] * frac
+    return np.clip(np.trunc(out), -32768, 32767).astype("<i2").tobytes()
@@ -2,13 +2,20 @@ from __future__ import annotations
 
 import argparse
 import asyncio
-import json
 from pathlib import Path
 
+from russo import _json
 from russo.config import build_component, build_registry, load_config
 from russo.models import TestRunReport
 from russo.pipeline import DefaultTestRunner, PipelineDependencies
 
+try:
+    import uvloop
+
+    _HAS_UVLOOP = True
+except ImportError:
+    _HAS_UVLOOP = False
+
 
 def _parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(prog="russo", description="Audio LLM test runner")
@@ -63,7 +70,7 @@ async def _run_from_config(
     )
 
     if report_path:
-        Path(report_path).write_text(json.dumps(report.to_dict(), indent=2))
+        Path(report_path).write_bytes(_json.dumps_bytes(report.to_dict(), indent=True))
     return report
 
 
@@ -75,7 +82,8 @@ def main() -> int:
             args.report,
             runs=args.runs,
             max_concurrency=args.max_concurrency,
-        )
+        ),
+        loop_factory=uvloop.new_event_loop if _HAS_UVLOOP else None,
     )
     return 0
 
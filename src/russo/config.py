@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+from russo import _json
 from russo.models import AudioResponseExpectation, AudioSampleSpec, TestCaseSpec, ToolCallExpectation, ToolDefinition
 from russo.registry import ComponentRegistry
 
@@ -44,11 +44,13 @@ def _load_yaml(path: Path) -> dict[str, Any]:
         import yaml
     except ImportError as exc:
         raise RuntimeError("PyYAML is required to load YAML configs.") from exc
-    return yaml.safe_load(path.read_text())
+    # libyaml's C loader is much faster; PyYAML builds without it only have SafeLoader.
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return yaml.load(path.read_bytes(), Loader=loader)
 
 
 def _load_json(path: Path) -> dict[str, Any]:
-    return json.loads(path.read_text())
+    return _json.loads(path.read_bytes())
 
 
 def _parse_component(payload: dict[str, Any]) -> ComponentRef:
@@ -129,6 +131,6 @@ def build_registry(config: Config) -> ComponentRegistry:
 
 
 def build_component(registry: ComponentRegistry, ref: ComponentRef) -> Any:
-    if ref.class_path and ref.name not in registry._registry:
+    if ref.class_path and ref.name not in registry:
         registry.register_path(ref.name, ref.class_path)
     return registry.build(ref.name, **ref.params)
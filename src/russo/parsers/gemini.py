@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from typing import Any
 
+from russo import _json
 from russo._types import AgentResponse, ToolCall
 
 
@@ -37,9 +38,7 @@ class GeminiResponseParser:
                     name = _get_attr_or_key(fc, "name", "")
                     args = _get_attr_or_key(fc, "args", {})
                     if isinstance(args, str):
-                        import json
-
-                        args = json.loads(args)
+                        args = _json.loads(args)
                     tool_calls.append(ToolCall(name=name, arguments=dict(args) if args else {}))
 
         return AgentResponse(tool_calls=tool_calls, raw=raw_response)
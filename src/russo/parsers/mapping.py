@@ -5,6 +5,7 @@ from __future__ import annotations
 import json
 from typing import Any
 
+from russo import _json
 from russo._types import AgentResponse, ToolCall
 
 
@@ -51,6 +52,7 @@ class JsonResponseParser:
         single: bool = False,
     ) -> None:
         self.tool_calls_key = tool_calls_key
+        self._path = tuple(tool_calls_key.split("."))
         self.name_key = name_key
         self.arguments_key = arguments_key
         self.single = single
@@ -71,7 +73,7 @@ class JsonResponseParser:
 
     def _try_parse(self, obj: Any) -> list[ToolCall] | None:
         """Extract tool calls from a single response object. Returns None on miss."""
-        raw_calls = _extract_path(obj, self.tool_calls_key)
+        raw_calls = _extract_path(obj, self._path)
         if raw_calls is None:
             return None
 
@@ -91,7 +93,7 @@ class JsonResponseParser:
             arguments = tc.get(self.arguments_key, {})
             if isinstance(arguments, str):
                 try:
-                    arguments = json.loads(arguments)
+                    arguments = _json.loads(arguments)
                 except (json.JSONDecodeError, TypeError):
                     arguments = {}
             tool_calls.append(ToolCall(name=name, arguments=arguments if isinstance(arguments, dict) else {}))
@@ -99,10 +101,10 @@ class JsonResponseParser:
         return tool_calls if tool_calls else None
 
 
-def _extract_path(obj: Any, path: str) -> Any:
-    """Walk a dot-separated key path through nested dicts."""
+def _extract_path(obj: Any, path: tuple[str, ...]) -> Any:
+    """Walk a pre-split key path through nested dicts."""
     current = obj
-    for key in path.split("."):
+    for key in path:
         if isinstance(current, dict):
             if key not in current:
                 return None
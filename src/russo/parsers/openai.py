@@ -5,6 +5,7 @@ from __future__ import annotations
 import json
 from typing import Any
 
+from russo import _json
 from russo._types import AgentResponse, ToolCall
 
 
@@ -43,7 +44,7 @@ class OpenAIResponseParser:
                 arguments_raw = _get_attr_or_key(function, "arguments", "{}")
                 if isinstance(arguments_raw, str):
                     try:
-                        arguments = json.loads(arguments_raw)
+                        arguments = _json.loads(arguments_raw)
                     except (json.JSONDecodeError, TypeError):
                         arguments = {}
                 elif isinstance(arguments_raw, dict):
@@ -10,6 +10,7 @@ Provides:
 
 from __future__ import annotations
 
+import contextlib
 from typing import Any
 
 import pytest
@@ -134,6 +135,13 @@ async def russo_result(
     Reads marker kwargs, resolves synthesizer/agent/evaluator fixtures,
     runs the pipeline, and returns the result.
 
+    If the agent is an async context manager (e.g. ``WebSocketAgent``,
+    ``HttpAgent``), it is entered around the test's runs and exited
+    afterwards, so ``russo_agent`` can stay a plain sync fixture and
+    connections never outlive the event loop that opened them. The
+    built-in agents count nested entries, so an agent your own fixture
+    already opened keeps its connection and is left open.
+
     Marker kwargs:
         prompt (str): Single text prompt.
         prompts (list[str]): Multiple text prompts (runs all concurrently).
@@ -187,25 +195,29 @@ async def russo_result(
     # --- decide execution mode ---
     is_batch = bool(prompts) or runs > 1
 
-    if is_batch:
-        effective_prompts = prompts if prompts else [prompt]
-        result: EvalResult | BatchResult = await run_concurrent(
-            prompts=effective_prompts,
-            synthesizer=synthesizer,
-            agent=agent,
-            evaluator=evaluator,
-            expect=expect,
-            runs=runs,
-            max_concurrency=max_concurrency,
-        )
-    else:
-        result = await run(
-            prompt=prompt,
-            synthesizer=synthesizer,
-            agent=agent,
-            evaluator=evaluator,
-            expect=expect,
-        )
+    async with contextlib.AsyncExitStack() as stack:
+        if isinstance(agent, contextlib.AbstractAsyncContextManager):
+            await stack.enter_async_context(agent)
+
+        if is_batch:
+            effective_prompts = prompts if prompts else [prompt]
+            result: EvalResult | BatchResult = await run_concurrent(
+                prompts=effective_prompts,
+                synthesizer=synthesizer,
+                agent=agent,
+                evaluator=evaluator,
+                expect=expect,
+                runs=runs,
+                max_concurrency=max_concurrency,
+            )
+        else:
+            result = await run(
+                prompt=prompt,
+                synthesizer=synthesizer,
+                agent=agent,
+                evaluator=evaluator,
+                expect=expect,
+            )
 
     _reporter.add(request.node.nodeid, result)
     return result
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import functools
 import importlib
 from dataclasses import dataclass
 from typing import Any, Callable
 
 
+@functools.lru_cache(maxsize=256)
 def import_symbol(path: str) -> Any:
     module_path, _, symbol_name = path.rpartition(".")
     if not module_path:
@@ -40,5 +42,8 @@ class ComponentRegistry:
             raise KeyError(f"Component '{name}' not found.")
         return self._registry[name]
 
+    def __contains__(self, name: object) -> bool:
+        return name in self._registry
+
     def build(self, name: str, **kwargs: Any) -> Any:
         return self.get(name).build(**kwargs)
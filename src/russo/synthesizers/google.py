@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import Literal
+import asyncio
+from typing import Any, Literal
 
 from google import genai
 from google.genai import types
@@ -39,17 +40,20 @@ class GoogleSynthesizer:
         self.audio_format = audio_format
         self.sample_rate = sample_rate
 
+        self._client_kwargs: dict[str, Any]
         if api_key:
-            self._client = genai.Client(api_key=api_key)
+            self._client_kwargs = {"api_key": api_key}
         elif vertexai:
-            self._client = genai.Client(
-                vertexai=True,
-                project=project,
-                location=location or "us-central1",
-            )
+            self._client_kwargs = {
+                "vertexai": True,
+                "project": project,
+                "location": location or "us-central1",
+            }
         else:
             # Fall back: let the SDK resolve from env (GOOGLE_API_KEY, ADC, etc.)
-            self._client = genai.Client()
+            self._client_kwargs = {}
+        self._client = genai.Client(**self._client_kwargs)
+        self._client_loop: asyncio.AbstractEventLoop | None = None
 
     async def synthesize(self, text: str) -> Audio:
         """Convert text to audio using Gemini TTS."""
@@ -59,7 +63,7 @@ class GoogleSynthesizer:
             role="user",
             parts=[types.Part.from_text(text=text)],
         )
-        response = await self._client.aio.models.generate_content(
+        response = await self._get_client().aio.models.generate_content(
             model=self.model,
             contents=contents,
             config=types.GenerateContentConfig(
@@ -82,3 +86,16 @@ class GoogleSynthesizer:
             format=self.audio_format,
             sample_rate=self.sample_rate,
         )
+
+    def _get_client(self) -> genai.Client:
+        """Return the client, rebuilding it if the running event loop changed."""
+        # genai.Client's async transport binds to the first loop that uses it, so a
+        # synthesizer shared across loops (e.g. a session-scoped pytest fixture with
+        # per-test loops) needs a fresh client per loop.
+        loop = asyncio.get_running_loop()
+        if self._client_loop is None:
+            self._client_loop = loop
+        elif self._client_loop is not loop:
+            self._client = genai.Client(**self._client_kwargs)
+            self._client_loop = loop
+        return self._client
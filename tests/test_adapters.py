@@ -1,15 +1,26 @@
-"""Tests for Gemini adapters — GeminiAgent + GeminiLiveAgent, unit + integration."""
+"""Tests for agent adapters — GeminiAgent + GeminiLiveAgent (unit + integration), HttpAgent, WebSocketAgent."""
 
 from __future__ import annotations
 
+import asyncio
+import base64
+import io
+import json
+import pickle
+import wave
+from pathlib import Path
 from typing import Any
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
 
 from russo._protocols import Agent
 from russo._types import AgentResponse, Audio
 from russo.adapters.gemini import GeminiAgent, GeminiLiveAgent
+from russo.adapters.http import HttpAgent
+from russo.adapters.websocket import WebSocketAgent
+from russo.audio import AudioManager
 from tests.conftest import GEMINI_LIVE_MODEL_GOOGLE_AI, GEMINI_LIVE_MODEL_VERTEX
 
 
@@ -616,3 +627,363 @@ class TestGeminiLiveAgentIntegration:
         result = await agent.run(audio)
 
         assert isinstance(result, AgentResponse)
+
+
+# ===========================================================================
+# HttpAgent
+# ===========================================================================
+def _http_agent(handler: Any, **kwargs: Any) -> HttpAgent:
+    """HttpAgent whose requests are served in-process by *handler*."""
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return HttpAgent(url="http://agent.test/voice", client=client, **kwargs)
+
+
+class TestHttpAgentRun:
+    @pytest.fixture
+    def audio(self) -> Audio:
+        return Audio(data=b"fake-wav-bytes", format="wav", sample_rate=24000)
+
+    async def test_sends_base64_payload(self, audio: Audio) -> None:
+        seen: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            return httpx.Response(200, json={"tool_calls": []})
+
+        agent = _http_agent(handler, headers={"X-Test": "1"})
+        await agent.run(audio)
+
+        body = json.loads(seen[0].content)
+        assert seen[0].method == "POST"
+        assert seen[0].headers["X-Test"] == "1"
+        assert base64.b64decode(body["audio"]) == audio.data
+        assert body["format"] == "wav"
+
+    async def test_send_bytes_posts_raw_audio(self, audio: Audio) -> None:
+        seen: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            return httpx.Response(200, json={"tool_calls": []})
+
+        agent = _http_agent(handler, send_bytes=True)
+        await agent.run(audio)
+
+        assert seen[0].content == audio.data
+        assert seen[0].headers["Content-Type"] == "audio/wav"
+
+    async def test_default_parse(self, audio: Audio) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json={"tool_calls": [{"name": "book_flight", "arguments": {"to": "LA"}}]})
+
+        result = await _http_agent(handler).run(audio)
+
+        assert len(result.tool_calls) == 1
+        assert result.tool_calls[0].name == "book_flight"
+        assert result.tool_calls[0].arguments == {"to": "LA"}
+
+    async def test_http_error_propagates(self, audio: Audio) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(500)
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await _http_agent(handler).run(audio)
+
+    async def test_owned_client_reused_across_runs(self, audio: Audio) -> None:
+        agent = HttpAgent(url="http://agent.test/voice")
+        first = agent._get_client()
+        assert agent._get_client() is first
+        await agent.aclose()
+        assert agent._client is None
+
+    def test_new_client_per_event_loop(self) -> None:
+        agent = HttpAgent(url="http://agent.test/voice")
+
+        async def get_client() -> httpx.AsyncClient:
+            return agent._get_client()
+
+        first = asyncio.run(get_client())
+        second = asyncio.run(get_client())
+
+        assert second is not first
+        assert agent._client is second
+
+    async def test_owned_client_follows_redirects(self) -> None:
+        async with HttpAgent(url="http://agent.test/voice") as agent:
+            assert agent._get_client().follow_redirects
+
+    async def test_context_manager_closes_owned_client(self, audio: Audio) -> None:
+        async with HttpAgent(url="http://agent.test/voice") as agent:
+            client = agent._get_client()
+        assert client.is_closed
+        assert agent._client is None
+
+    async def test_nested_context_manager_closes_on_outer_exit(self) -> None:
+        async with HttpAgent(url="http://agent.test/voice") as agent:
+            client = agent._get_client()
+            async with agent:
+                pass
+            assert not client.is_closed
+        assert client.is_closed
+
+    async def test_context_manager_leaves_user_client_open(self, audio: Audio) -> None:
+        client = httpx.AsyncClient()
+        async with HttpAgent(url="http://agent.test/voice", client=client):
+            pass
+        assert not client.is_closed
+        await client.aclose()
+
+    async def test_audio_encoded_once_per_instance(self, audio: Audio) -> None:
+        bodies: list[dict[str, Any]] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            bodies.append(json.loads(request.content))
+            return httpx.Response(200, json={"tool_calls": []})
+
+        agent = _http_agent(handler)
+        await agent.run(audio)
+        encoded = audio.base64
+        await agent.run(audio)
+
+        assert audio.base64 is encoded
+        assert bodies[0]["audio"] == bodies[1]["audio"] == encoded
+        assert audio.model_dump() == {
+            "data": b"fake-wav-bytes",
+            "format": "wav",
+            "sample_rate": 24000,
+            "channels": 1,
+            "sample_width": 2,
+        }
+
+    def test_audio_reencoded_when_data_changes(self, audio: Audio) -> None:
+        encoded = audio.base64
+        copy = audio.model_copy(update={"data": b"other-bytes"})
+        audio.data = b"new-bytes"
+
+        assert encoded == base64.b64encode(b"fake-wav-bytes").decode()
+        assert audio.base64 == base64.b64encode(b"new-bytes").decode()
+        assert copy.base64 == base64.b64encode(b"other-bytes").decode()
+
+
+# ===========================================================================
+# AudioManager
+# ===========================================================================
+class TestAudioManager:
+    @pytest.mark.parametrize(("sample_rate", "channels", "sample_width"), [(24000, 1, 2), (16000, 2, 2), (8000, 1, 1)])
+    def test_matches_wave_module(self, sample_rate: int, channels: int, sample_width: int) -> None:
+        pcm = bytes(range(256)) * 4
+        buf = io.BytesIO()
+        with wave.open(buf, "wb") as wf:
+            wf.setnchannels(channels)
+            wf.setsampwidth(sample_width)
+            wf.setframerate(sample_rate)
+            wf.writeframes(pcm)
+
+        wav = AudioManager.pcm_to_wav(pcm, sample_rate=sample_rate, channels=channels, sample_width=sample_width)
+
+        assert wav == buf.getvalue()
+
+    def test_audio_save_round_trips(self, tmp_path: Path) -> None:
+        audio = Audio(data=b"\x01\x00" * 480, format="wav", sample_rate=16000)
+        path = audio.save(tmp_path / "clip.wav")
+
+        with wave.open(str(path), "rb") as wf:
+            assert wf.getframerate() == 16000
+            assert wf.readframes(wf.getnframes()) == audio.data
+
+    @pytest.mark.parametrize("odd_byte", [b"", b"\x7f"])
+    @pytest.mark.parametrize(("from_rate", "to_rate"), [(24000, 16000), (16000, 24000), (44100, 16000)])
+    def test_resample_numpy_matches_pure_python(
+        self, monkeypatch: pytest.MonkeyPatch, from_rate: int, to_rate: int, odd_byte: bytes
+    ) -> None:
+        pytest.importorskip("numpy")
+        from russo.audio import manager
+
+        pcm = b"".join(i.to_bytes(2, "little", signed=True) for i in range(-32768, 32768, 97)) + odd_byte
+        vectorized = AudioManager.resample_pcm_16bit(pcm, from_rate, to_rate)
+        monkeypatch.setattr(manager, "_HAS_NUMPY", False)
+
+        assert vectorized == AudioManager.resample_pcm_16bit(pcm, from_rate, to_rate)
+
+    def test_prepared_audio_reused_per_instance(self) -> None:
+        audio = Audio(data=b"\x01\x00" * 480, format="pcm", sample_rate=24000)
+
+        with patch.object(AudioManager, "resample_pcm_16bit", wraps=AudioManager.resample_pcm_16bit) as resample:
+            first = AudioManager.prepare_for_live(audio)
+            second = AudioManager.prepare_for_live(audio)
+            AudioManager.prepare_for_live(Audio(data=audio.data, format="pcm", sample_rate=24000))
+
+        assert first is second
+        assert resample.call_count == 2  # once per Audio instance
+        assert audio == Audio(data=audio.data, format="pcm", sample_rate=24000)
+
+    def test_prepared_audio_redone_when_fields_change(self) -> None:
+        audio = Audio(data=b"\x01\x00" * 480, format="pcm", sample_rate=24000)
+        at_24k, _ = AudioManager.prepare_for_live(audio)
+
+        audio.sample_rate = 16000
+        at_16k, _ = AudioManager.prepare_for_live(audio)
+        copy, _ = AudioManager.prepare_for_live(audio.model_copy(update={"data": b"\x02\x00" * 480}))
+
+        assert len(at_24k) == 640
+        assert at_16k == audio.data
+        assert copy == b"\x02\x00" * 480
+
+    def test_prepared_audio_not_copied_or_pickled(self) -> None:
+        audio = Audio(data=b"\x01\x00" * 480, format="pcm", sample_rate=24000)
+        fresh = pickle.dumps(audio)
+        AudioManager.prepare_for_live(audio)
+        assert audio.base64
+
+        copies = [audio.model_copy(), audio.model_copy(deep=True), pickle.loads(pickle.dumps(audio))]
+
+        assert pickle.dumps(audio) == fresh
+        assert all("_prepared" not in c.__dict__ and "_base64" not in c.__dict__ for c in copies)
+        assert all(c == audio for c in copies)
+
+
+# ===========================================================================
+# WebSocketAgent
+# ===========================================================================
+@pytest.fixture
+async def echo_tool_server():
+    """Local WebSocket server that answers every message with a tool call.
+
+    Yields ``(url, connections)`` where *connections* counts accepted connections.
+    """
+    websockets = pytest.importorskip("websockets")
+    connections = 0
+
+    async def handler(ws: Any) -> None:
+        nonlocal connections
+        connections += 1
+        async for message in ws:
+            fmt = json.loads(message)["format"]
+            await ws.send(json.dumps({"tool_calls": [{"name": "echo", "arguments": {"format": fmt}}]}))
+
+    async with websockets.serve(handler, "localhost", 0) as server:
+        port = server.sockets[0].getsockname()[1]
+        yield f"ws://localhost:{port}", lambda: connections
+
+
+class TestWebSocketAgentRun:
+    @pytest.fixture
+    def audio(self) -> Audio:
+        return Audio(data=b"fake-wav-bytes", format="wav", sample_rate=24000)
+
+    async def test_connection_per_run(self, echo_tool_server: Any, audio: Audio) -> None:
+        url, connections = echo_tool_server
+        agent = WebSocketAgent(url=url)
+
+        first = await agent.run(audio)
+        await agent.run(audio)
+
+        assert first.tool_calls[0].name == "echo"
+        assert first.tool_calls[0].arguments == {"format": "wav"}
+        assert connections() == 2
+
+    async def test_context_manager_reuses_connection(self, echo_tool_server: Any, audio: Audio) -> None:
+        url, connections = echo_tool_server
+
+        async with WebSocketAgent(url=url) as agent:
+            results = await asyncio.gather(*(agent.run(audio) for _ in range(3)))
+
+        assert all(r.tool_calls[0].name == "echo" for r in results)
+        assert connections() == 1
+
+    async def test_nested_enter_reuses_connection(self, echo_tool_server: Any, audio: Audio) -> None:
+        url, connections = echo_tool_server
+
+        async with WebSocketAgent(url=url) as agent:
+            ws = agent._ws
+            async with agent:
+                await agent.run(audio)
+            assert agent._ws is ws
+            await agent.run(audio)
+        assert agent._ws is None
+        assert connections() == 1
+
+    async def test_request_id_routes_out_of_order_replies(self, audio: Audio) -> None:
+        websockets = pytest.importorskip("websockets")
+
+        async def handler(ws: Any) -> None:
+            async def reply(message: dict[str, Any]) -> None:
+                # Answer later requests first so replies arrive out of order.
+                await asyncio.sleep(0.05 / message["rid"])
+                call = {"name": "echo", "arguments": {"audio": message["audio"]}}
+                await ws.send(json.dumps({"rid": message["rid"], "tool_calls": [call]}))
+
+            async with asyncio.TaskGroup() as tg:
+                async for message in ws:
+                    tg.create_task(reply(json.loads(message)))
+
+        clips = [Audio(data=bytes([i]) * 8, format="wav") for i in range(3)]
+        async with websockets.serve(handler, "localhost", 0) as server:
+            port = server.sockets[0].getsockname()[1]
+            async with WebSocketAgent(url=f"ws://localhost:{port}", request_id_field="rid") as agent:
+                results = await asyncio.gather(*(agent.run(clip) for clip in clips))
+
+        assert [r.tool_calls[0].arguments["audio"] for r in results] == [clip.base64 for clip in clips]
+
+    async def test_request_id_echoed_as_string(self, audio: Audio) -> None:
+        websockets = pytest.importorskip("websockets")
+
+        async def handler(ws: Any) -> None:
+            async for message in ws:
+                rid = json.loads(message)["rid"]
+                await ws.send(json.dumps({"rid": [rid], "tool_calls": []}))  # unhashable, dropped
+                await ws.send(json.dumps({"rid": str(rid), "tool_calls": [{"name": "echo"}]}))
+
+        async with websockets.serve(handler, "localhost", 0) as server:
+            port = server.sockets[0].getsockname()[1]
+            url = f"ws://localhost:{port}"
+            async with WebSocketAgent(url=url, request_id_field="rid", response_timeout=1) as agent:
+                results = await asyncio.gather(agent.run(audio), agent.run(audio))
+
+        assert [r.tool_calls[0].name for r in results] == ["echo", "echo"]
+
+    async def test_timed_out_reply_not_read_by_next_run(self) -> None:
+        websockets = pytest.importorskip("websockets")
+        connections = 0
+
+        async def handler(ws: Any) -> None:
+            nonlocal connections
+            connections += 1
+            async for message in ws:
+                audio = json.loads(message)["audio"]
+                if audio == Audio(data=b"slow").base64:
+                    await asyncio.sleep(0.1)
+                await ws.send(json.dumps({"tool_calls": [{"name": "echo", "arguments": {"audio": audio}}]}))
+
+        async with websockets.serve(handler, "localhost", 0) as server:
+            port = server.sockets[0].getsockname()[1]
+            async with WebSocketAgent(url=f"ws://localhost:{port}", response_timeout=0.05) as agent:
+                timed_out = await agent.run(Audio(data=b"slow"))
+                await asyncio.sleep(0.1)
+                fast = Audio(data=b"fast")
+                result = await agent.run(fast)
+
+        assert timed_out.tool_calls == []
+        assert result.tool_calls[0].arguments == {"audio": fast.base64}
+        assert connections == 2
+
+    @pytest.mark.parametrize(("send_bytes", "expected_type"), [(False, str), (True, bytes)])
+    async def test_frame_type(self, audio: Audio, send_bytes: bool, expected_type: type) -> None:
+        """JSON messages go out as text frames, raw audio as binary frames."""
+        websockets = pytest.importorskip("websockets")
+        received: list[Any] = []
+
+        async def handler(ws: Any) -> None:
+            async for message in ws:
+                received.append(message)
+                await ws.send(json.dumps({"tool_calls": []}))
+
+        async with websockets.serve(handler, "localhost", 0) as server:
+            port = server.sockets[0].getsockname()[1]
+            await WebSocketAgent(url=f"ws://localhost:{port}", send_bytes=send_bytes).run(audio)
+
+        assert type(received[0]) is expected_type
+
+    def test_request_id_requires_json_mode(self) -> None:
+        with pytest.raises(ValueError, match="request_id_field"):
+            WebSocketAgent(url="ws://localhost", send_bytes=True, request_id_field="rid")
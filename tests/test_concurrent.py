@@ -227,6 +227,38 @@ class TestRunConcurrent:
         assert not result.passed  # not all passed
         assert 0 < result.pass_rate < 1.0
 
+    async def test_error_cancels_remaining_runs(self) -> None:
+        """An agent error is raised as is and cancels the other runs."""
+        cancelled: list[int] = []
+
+        class ErroringAgent:
+            def __init__(self) -> None:
+                self.call_count = 0
+
+            async def run(self, audio: Audio) -> AgentResponse:
+                self.call_count += 1
+                index = self.call_count
+                if index == 1:
+                    raise RuntimeError("agent crashed")
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    cancelled.append(index)
+                    raise
+                return AgentResponse()
+
+        with pytest.raises(RuntimeError, match="agent crashed"):
+            await run_concurrent(
+                prompts="test",
+                synthesizer=FakeSynthesizer(),
+                agent=ErroringAgent(),
+                evaluator=ExactEvaluator(),
+                expect=[ToolCall(name="book_flight")],
+                runs=3,
+            )
+
+        assert sorted(cancelled) == [2, 3]
+
     async def test_max_concurrency(self) -> None:
         """Verify max_concurrency limits simultaneous runs."""
         concurrent_count = 0
@@ -258,6 +290,41 @@ class TestRunConcurrent:
         assert result.passed is True
         assert max_seen <= 2
 
+    async def test_max_concurrency_overlaps_synthesis_with_agent(self) -> None:
+        """With every agent slot busy, queued runs should already be synthesizing."""
+        agent_busy = 0
+        synth_while_agent_busy = 0
+
+        class SlowSynthesizer:
+            async def synthesize(self, text: str) -> Audio:
+                nonlocal synth_while_agent_busy
+                if agent_busy:
+                    synth_while_agent_busy += 1
+                await asyncio.sleep(0.01)
+                return Audio(data=b"fake", format="wav", sample_rate=24000)
+
+        class SlowAgent:
+            async def run(self, audio: Audio) -> AgentResponse:
+                nonlocal agent_busy
+                agent_busy += 1
+                await asyncio.sleep(0.05)
+                agent_busy -= 1
+                return AgentResponse(tool_calls=[ToolCall(name="book_flight")])
+
+        result = await run_concurrent(
+            prompts="test",
+            synthesizer=SlowSynthesizer(),
+            agent=SlowAgent(),
+            evaluator=ExactEvaluator(ignore_extra_args=True),
+            expect=[ToolCall(name="book_flight")],
+            runs=4,
+            max_concurrency=1,
+        )
+
+        assert result.total == 4
+        assert result.passed is True
+        assert synth_while_agent_busy > 0
+
     async def test_runs_are_concurrent(self) -> None:
         """Verify that runs actually execute concurrently (not sequentially)."""
         synth = FakeSynthesizer()
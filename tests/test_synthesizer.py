@@ -2,18 +2,41 @@
 
 from __future__ import annotations
 
+import asyncio
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from russo._cache import AudioCache, CachedSynthesizer
+from russo._cache import AudioCache, CachedSynthesizer, MemoryAudioCache
 from russo._protocols import Synthesizer
 from russo._types import Audio
 from russo.synthesizers.google import GoogleSynthesizer
 from tests.conftest import FakeSynthesizer, make_gemini_tts_response
 
 
+class _MissCountingCache(AudioCache):
+    """AudioCache that sets ``all_missed`` once *expected_misses* lookups have missed.
+
+    A caller joins the in-flight synthesis in the same step its lookup
+    returns, so once the event is set every caller is waiting on it.
+    """
+
+    def __init__(self, cache_dir: Path, *, expected_misses: int) -> None:
+        super().__init__(cache_dir)
+        self.expected_misses = expected_misses
+        self.misses = 0
+        self.all_missed = asyncio.Event()
+
+    async def aget(self, key: str) -> Audio | None:
+        audio = await super().aget(key)
+        if audio is None:
+            self.misses += 1
+            if self.misses == self.expected_misses:
+                self.all_missed.set()
+        return audio
+
+
 # ---------------------------------------------------------------------------
 # Protocol conformance
 # ---------------------------------------------------------------------------
@@ -84,6 +107,24 @@ class TestGoogleSynthesizer:
         assert audio.sample_rate == 24000
         mock_client.aio.models.generate_content.assert_awaited_once()
 
+    def test_client_rebuilt_per_event_loop(self) -> None:
+        """A synthesizer reused across event loops gets a fresh client per loop, not per call."""
+        with patch("russo.synthesizers.google.genai") as mock_genai:
+            mock_genai.Client.return_value.aio.models.generate_content = AsyncMock(
+                return_value=make_gemini_tts_response(b"pcm")
+            )
+            synth = GoogleSynthesizer(api_key="test-key")
+
+            async def twice() -> None:
+                await synth.synthesize("one")
+                await synth.synthesize("two")
+
+            asyncio.run(twice())
+            assert mock_genai.Client.call_count == 1
+            asyncio.run(twice())
+            assert mock_genai.Client.call_count == 2
+            mock_genai.Client.assert_called_with(api_key="test-key")
+
     @pytest.mark.asyncio
     async def test_synthesize_empty_response(self) -> None:
         """If Gemini returns no candidates, we get empty audio data."""
@@ -168,6 +209,46 @@ class TestCachedSynthesizer:
         assert audio1.data == audio2.data
         assert cache.size() == 1
 
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_synthesis(self, tmp_path: Path) -> None:
+        """Concurrent calls for the same uncached prompt make a single inner call."""
+        cache = _MissCountingCache(tmp_path / "cache", expected_misses=5)
+
+        class GatedSynthesizer(FakeSynthesizer):
+            async def synthesize(self, text: str) -> Audio:
+                await cache.all_missed.wait()  # hold the synthesis until every caller has joined it
+                return await super().synthesize(text)
+
+        inner = GatedSynthesizer()
+        synth = CachedSynthesizer(inner, cache=cache)
+
+        results = await asyncio.gather(*(synth.synthesize("hello") for _ in range(5)))
+
+        assert inner.calls == ["hello"]
+        assert all(audio.data == results[0].data for audio in results)
+        assert synth._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_concurrent_miss_failure_propagates(self, tmp_path: Path) -> None:
+        """A failed shared synthesis raises in every waiter and is retried on the next call."""
+        cache = _MissCountingCache(tmp_path / "cache", expected_misses=3)
+
+        async def fail(text: str) -> Audio:
+            await cache.all_missed.wait()
+            raise RuntimeError("tts down")
+
+        inner = AsyncMock(side_effect=fail)
+        synth = CachedSynthesizer(MagicMock(synthesize=inner), cache=cache)
+
+        results = await asyncio.gather(*(synth.synthesize("hello") for _ in range(3)), return_exceptions=True)
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert inner.await_count == 1
+
+        with pytest.raises(RuntimeError):
+            await synth.synthesize("hello")
+        assert inner.await_count == 2
+
     @pytest.mark.asyncio
     async def test_different_prompts_cached_separately(self, fake_synth: FakeSynthesizer, tmp_path: Path) -> None:
         cache = AudioCache(tmp_path / "cache")
@@ -300,6 +381,80 @@ class TestAudioCache:
         assert not (cache.cache_dir / "bad.audio").exists()
         assert not meta_path.exists()
 
+    def test_repeat_get_served_from_memory(self, tmp_path: Path) -> None:
+        cache = AudioCache(tmp_path / "cache")
+        cache.put("key1", Audio(data=b"some-audio", format="wav"))
+
+        first = cache.get("key1")
+        (cache.cache_dir / "key1.audio").unlink()
+        second = cache.get("key1")
+
+        assert first is not None
+        assert second is first
+
+    def test_put_invalidates_memory_entry(self, tmp_path: Path) -> None:
+        cache = AudioCache(tmp_path / "cache")
+        cache.put("key1", Audio(data=b"old", format="wav"))
+        cache.get("key1")
+
+        cache.put("key1", Audio(data=b"new", format="wav"))
+        result = cache.get("key1")
+        assert result is not None
+        assert result.data == b"new"
+
+    async def test_async_put_and_get(self, tmp_path: Path) -> None:
+        cache = AudioCache(tmp_path / "cache", memory_capacity=0)
+        await cache.aput("key1", Audio(data=b"some-audio", format="mp3"), prompt="test")
+
+        result = await cache.aget("key1")
+        assert result is not None
+        assert result.data == b"some-audio"
+        assert result.format == "mp3"
+        assert await cache.aget("missing") is None
+
+    async def test_concurrent_puts_same_key(self, tmp_path: Path) -> None:
+        cache = AudioCache(tmp_path / "cache", memory_capacity=0)
+        clips = [Audio(data=bytes([i]) * 4096, format="wav") for i in range(8)]
+
+        await asyncio.gather(*(cache.aput("key1", clip) for clip in clips))
+
+        result = cache.get("key1")
+        assert result is not None
+        assert result.data in {clip.data for clip in clips}
+        assert sorted(p.name for p in cache.cache_dir.iterdir()) == ["key1.audio", "key1.meta"]
+
+    def test_memory_disabled(self, tmp_path: Path) -> None:
+        cache = AudioCache(tmp_path / "cache", memory_capacity=0)
+        cache.put("key1", Audio(data=b"some-audio", format="wav"))
+        cache.get("key1")
+        assert len(cache.memory) == 0
+
+
+# ---------------------------------------------------------------------------
+# MemoryAudioCache (unit tests)
+# ---------------------------------------------------------------------------
+class TestMemoryAudioCache:
+    def test_get_miss(self) -> None:
+        assert MemoryAudioCache().get("nonexistent") is None
+
+    def test_evicts_least_recently_used(self) -> None:
+        memory = MemoryAudioCache(capacity=2)
+        memory.put("a", Audio(data=b"1"))
+        memory.put("b", Audio(data=b"2"))
+        memory.get("a")  # promote "a"
+        memory.put("c", Audio(data=b"3"))
+
+        assert memory.get("a") is not None
+        assert memory.get("b") is None
+        assert memory.get("c") is not None
+        assert len(memory) == 2
+
+    def test_clear(self) -> None:
+        memory = MemoryAudioCache()
+        memory.put("a", Audio(data=b"1"))
+        memory.clear()
+        assert len(memory) == 0
+
 
 # ---------------------------------------------------------------------------
 # Integration tests (real API, skipped unless --integration)